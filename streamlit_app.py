@@ -1,19 +1,90 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import geopandas as gpd
-import json
-from shapely.geometry import Point, Polygon, LineString, shape
+import pyogrio
+import pyarrow as pa
+import pyarrow.csv
+import pyarrow.parquet as pq
+import shapely
+
+try:
+    import orjson as json  # 3-5x faster than stdlib json for parsing
+except ImportError:
+    import json
 from shapely import wkt
+from shapely.geometry import shape
+from pyproj import CRS
+import concurrent.futures
+import functools
+import hashlib
 import tempfile
 import os
+import threading
+import uuid
 import io
 import zipfile
+import zlib
 from pathlib import Path
 
+try:
+    from osgeo import gdal
+except ImportError:  # GDAL Python bindings are optional; fall back to temp files
+    gdal = None
+
 st.set_page_config(page_title="Geospatial Format Converter", layout="wide")
 
+# WKT type tags recognized by the geometry-column sniffer
+WKT_PREFIXES = ('POINT', 'LINESTRING', 'POLYGON', 'MULTIPOINT', 'MULTILINESTRING', 'MULTIPOLYGON')
+
+# OGR_SQLITE_PRAGMA is process-global GDAL config, so GeoPackage writes are
+# serialized to keep one export's pragma reset from clobbering another's
+GPKG_WRITE_LOCK = threading.Lock()
+
+@st.cache_data(show_spinner=False)
+def read_csv_cached(raw_bytes, sep, **csv_options):
+    """Parse CSV bytes into a DataFrame, cached on the file bytes and options.
+
+    Streamlit reruns the whole script on every widget interaction; caching on the
+    raw bytes means the file is only parsed once per upload/option combination.
+    """
+    # Arrow's multi-threaded parser is 3-5x faster and handles any single-char
+    # delimiter, but supports a narrower CSV dialect than the C engine
+    if len(sep) == 1 and 'names' not in csv_options and csv_options.get('decimal', '.') == '.':
+        arrow_options = {k: v for k, v in csv_options.items() if k != 'decimal'}
+        try:
+            return pd.read_csv(io.BytesIO(raw_bytes), sep=sep, engine="pyarrow", **arrow_options)
+        except (ValueError, TypeError, pa.ArrowInvalid):
+            pass  # Unsupported option combination or exotic quoting; use the C engine
+    return pd.read_csv(io.BytesIO(raw_bytes), sep=sep, **csv_options)
+
+@st.cache_data(show_spinner=False)
+def read_geofile_cached(raw_bytes, file_extension):
+    """Read GeoJSON/Parquet/GeoPackage bytes into a GeoDataFrame, cached on the bytes."""
+    if file_extension == "parquet":
+        return gpd.read_parquet(io.BytesIO(raw_bytes))
+    return gpd.read_file(io.BytesIO(raw_bytes), engine="pyogrio", use_arrow=True)
+
+@functools.lru_cache(maxsize=32)
+def cached_crs(crs_input):
+    """Parse a CRS string once; constructing pyproj CRS objects is expensive."""
+    return CRS.from_user_input(crs_input)
+
+def validate_crs(crs_input):
+    """Parse the user-entered CRS, reporting an error and returning None if invalid."""
+    try:
+        return cached_crs(crs_input)
+    except Exception as e:
+        st.error(f"Invalid CRS '{crs_input}': {e}")
+        return None
+
+@st.cache_data(show_spinner=False)
 def detect_geometry_columns(df):
-    """Detect potential geometry columns in the DataFrame."""
+    """Detect potential geometry columns in the DataFrame.
+
+    Cached so the per-column WKT/GeoJSON sampling only runs once per uploaded
+    DataFrame rather than on every widget interaction.
+    """
     geometry_candidates = []
     
     # Check for common geometry column names
@@ -25,30 +96,27 @@ def detect_geometry_columns(df):
     for col in df.columns:
         if col not in geometry_candidates:
             # Sample a few non-null values
-            sample = df[col].dropna().head(5)
-            
-            # Check if might be WKT
-            if sample.dtype == object and len(sample) > 0:
+            sample = df[col].dropna().head(16)
+
+            # Check if might be WKT. pandas 3 stores text in a dedicated str
+            # dtype rather than object, so accept both
+            if (pd.api.types.is_string_dtype(sample) or sample.dtype == object) and len(sample) > 0:
                 try:
-                    # Try to parse first element as WKT
-                    first_val = sample.iloc[0]
-                    if isinstance(first_val, str) and (
-                        first_val.startswith('POINT') or 
-                        first_val.startswith('POLYGON') or 
-                        first_val.startswith('MULTIPOLYGON') or
-                        first_val.startswith('LINESTRING') or
-                        first_val.startswith('MULTILINESTRING')
-                    ):
-                        wkt.loads(first_val)  # Try parsing
+                    # Vectorized prefix check over the sample (truncated to 32 chars,
+                    # enough to cover any WKT type tag), then parse one full value
+                    arr = sample.astype(str).str.upper().to_numpy(dtype='U32')
+                    if np.any([np.char.startswith(arr, p) for p in WKT_PREFIXES]):
+                        wkt.loads(sample.iloc[0])  # Try parsing
                         geometry_candidates.append(col)
                         continue
                 except Exception:
                     pass
                 
-                # Check if might be GeoJSON
+                # Check if might be GeoJSON; the key sniff rejects most non-GeoJSON
+                # strings before paying for a full JSON parse
                 try:
                     first_val = sample.iloc[0]
-                    if isinstance(first_val, str) and '{' in first_val and '}' in first_val:
+                    if isinstance(first_val, str) and '"type"' in first_val and '"coordinates"' in first_val:
                         geojson = json.loads(first_val)
                         if 'type' in geojson and 'coordinates' in geojson:
                             geometry_candidates.append(col)
@@ -58,6 +126,7 @@ def detect_geometry_columns(df):
     
     return geometry_candidates
 
+@st.cache_data(show_spinner=False)
 def convert_csv_to_geodataframe(df, mode, **kwargs):
     """
     Convert a pandas DataFrame to a GeoDataFrame based on the specified mode.
@@ -67,34 +136,57 @@ def convert_csv_to_geodataframe(df, mode, **kwargs):
     - 'wkt': Parse geometries from a WKT column
     - 'geojson': Parse geometries from a GeoJSON column
     """
-    crs = kwargs.get('crs', "EPSG:4326")
+    crs = cached_crs(kwargs.get('crs', "EPSG:4326"))
     
     if mode == 'points':
         lon_col = kwargs.get('lon_col')
         lat_col = kwargs.get('lat_col')
         
-        # Filter out rows with invalid coordinates
-        valid_coords = df[lon_col].notna() & df[lat_col].notna()
-        if not valid_coords.all():
-            st.warning(f"Found {(~valid_coords).sum()} rows with missing coordinates. These will be excluded.")
-            df = df[valid_coords].copy()
-        
-        # Create geometry column
-        geometry = [Point(xy) for xy in zip(df[lon_col], df[lat_col])]
+        # Coerce both coordinate columns once, mask non-finite values in the same
+        # pass, and build the geometries from the already-materialized arrays
+        lon = pd.to_numeric(df[lon_col], errors="coerce").to_numpy(dtype='float64')
+        lat = pd.to_numeric(df[lat_col], errors="coerce").to_numpy(dtype='float64')
+        mask = np.isfinite(lon) & np.isfinite(lat)
+        if not mask.all():
+            st.warning(f"Found {(~mask).sum()} rows with missing or invalid coordinates. These will be excluded.")
+            df = df.loc[mask].reset_index(drop=True)
+            lon = lon[mask]
+            lat = lat[mask]
+
+        # Create geometry column (vectorized; avoids per-row Point construction)
+        geometry = gpd.points_from_xy(lon, lat)
         gdf = gpd.GeoDataFrame(df, geometry=geometry, crs=crs)
         
     elif mode == 'wkt':
         geom_col = kwargs.get('geom_col')
         
-        # Filter out rows with missing geometry
-        valid_geoms = df[geom_col].notna()
-        if not valid_geoms.all():
-            st.warning(f"Found {(~valid_geoms).sum()} rows with missing geometries. These will be excluded.")
-            df = df[valid_geoms].copy()
-        
-        # Convert WKT strings to Shapely geometries
+        # Filter out rows with missing geometry (mask-based; avoids a full-frame copy)
+        mask = df[geom_col].notna().to_numpy()
+        if not mask.all():
+            st.warning(f"Found {(~mask).sum()} rows with missing geometries. These will be excluded.")
+            df = df.loc[mask].reset_index(drop=True)
+
+        # Convert WKT strings to Shapely geometries (vectorized; one GEOS call over the array)
         try:
-            geometry = df[geom_col].apply(wkt.loads)
+            geometry = None
+            str_values = df[geom_col].astype(str)
+
+            # Fast path for plain 2D POINT rows: pull the coordinates out with a
+            # vectorized regex and build points directly, skipping the WKT parser
+            # whose inner loop is per-token strtod. Anchored through the closing
+            # parenthesis so 3D points and trailing garbage fall through to the
+            # real parser instead of being silently truncated or accepted
+            point_pattern = r'POINT\s*\(\s*([-0-9eE.+]+)\s+([-0-9eE.+]+)\s*\)\s*'
+            if str_values.str.fullmatch(point_pattern).all():
+                coords = str_values.str.extract(point_pattern)
+                if coords.notna().all().all():
+                    geometry = shapely.points(
+                        coords[0].to_numpy(dtype='float64'),
+                        coords[1].to_numpy(dtype='float64')
+                    )
+
+            if geometry is None:
+                geometry = shapely.from_wkt(str_values.to_numpy())
             df_copy = df.drop(columns=[geom_col])
             gdf = gpd.GeoDataFrame(df_copy, geometry=geometry, crs=crs)
         except Exception as e:
@@ -104,15 +196,24 @@ def convert_csv_to_geodataframe(df, mode, **kwargs):
     elif mode == 'geojson':
         geom_col = kwargs.get('geom_col')
         
-        # Filter out rows with missing geometry
-        valid_geoms = df[geom_col].notna()
-        if not valid_geoms.all():
-            st.warning(f"Found {(~valid_geoms).sum()} rows with missing geometries. These will be excluded.")
-            df = df[valid_geoms].copy()
-        
-        # Convert GeoJSON strings to Shapely geometries
+        # Filter out rows with missing geometry (mask-based; avoids a full-frame copy)
+        mask = df[geom_col].notna().to_numpy()
+        if not mask.all():
+            st.warning(f"Found {(~mask).sum()} rows with missing geometries. These will be excluded.")
+            df = df.loc[mask].reset_index(drop=True)
+
+        # Convert GeoJSON strings to Shapely geometries (vectorized; parses JSON in C)
         try:
-            geometry = df[geom_col].apply(lambda x: shape(json.loads(x)))
+            values = df[geom_col]
+            if len(values) > 0 and isinstance(values.iloc[0], dict):
+                # Column already holds decoded GeoJSON mappings; build from the dicts
+                geometry = np.array([shape(v) for v in values], dtype=object)
+            elif pd.api.types.is_string_dtype(values) or values.dtype == object:
+                # Hand the raw string array straight to the C parser - one pass
+                # does both the JSON decode and the GEOS geometry build
+                geometry = shapely.from_geojson(values.to_numpy())
+            else:
+                geometry = shapely.from_geojson(values.astype(str).to_numpy())
             df_copy = df.drop(columns=[geom_col])
             gdf = gpd.GeoDataFrame(df_copy, geometry=geometry, crs=crs)
         except Exception as e:
@@ -121,31 +222,220 @@ def convert_csv_to_geodataframe(df, mode, **kwargs):
             
     return gdf
 
+def stream_csv_points_to_parquet(raw_bytes, sep, lon_col, lat_col, crs):
+    """Convert a points-mode CSV straight to GeoParquet in record batches.
+
+    Reads the CSV with Arrow's streaming reader and writes one row group per
+    batch, so peak memory is bounded by the batch size instead of growing to
+    several times the input file.
+    """
+    reader = pa.csv.open_csv(
+        io.BytesIO(raw_bytes),
+        read_options=pa.csv.ReadOptions(block_size=1 << 26),
+        parse_options=pa.csv.ParseOptions(delimiter=sep)
+    )
+    buffer = io.BytesIO()
+    writer = None
+    try:
+        for batch in reader:
+            df = batch.to_pandas()
+            # Same coercion and filtering as the points mode of
+            # convert_csv_to_geodataframe, so the download matches the preview
+            lon = pd.to_numeric(df[lon_col], errors="coerce").to_numpy(dtype='float64')
+            lat = pd.to_numeric(df[lat_col], errors="coerce").to_numpy(dtype='float64')
+            mask = np.isfinite(lon) & np.isfinite(lat)
+            if not mask.all():
+                df = df.loc[mask].reset_index(drop=True)
+                lon = lon[mask]
+                lat = lat[mask]
+
+            gdf = gpd.GeoDataFrame(df, geometry=gpd.points_from_xy(lon, lat), crs=crs)
+            table = pa.table(gdf.to_arrow(geometry_encoding="geoarrow"))
+
+            if writer is None:
+                # ParquetWriter does not attach the GeoParquet "geo" file
+                # metadata that GeoDataFrame.to_parquet writes, and without it
+                # gpd.read_parquet rejects the stream. Probe the metadata from
+                # a one-row write; its bbox only covers that row, so drop it
+                probe = io.BytesIO()
+                gdf.head(1).to_parquet(probe, geometry_encoding="geoarrow")
+                geo_meta = json.loads(pq.read_schema(probe).metadata[b"geo"])
+                for column_meta in geo_meta["columns"].values():
+                    column_meta.pop("bbox", None)
+                encoded = json.dumps(geo_meta)
+                if not isinstance(encoded, bytes):
+                    encoded = encoded.encode()
+                schema = table.schema.with_metadata(
+                    {**(table.schema.metadata or {}), b"geo": encoded}
+                )
+                writer = pq.ParquetWriter(buffer, schema, compression="zstd", compression_level=3)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    buffer.seek(0)
+    return buffer.getvalue()
+
+def store_gdf(gdf):
+    """Keep the working GeoDataFrame in session state as an Arrow table.
+
+    Arrow stores columns as contiguous typed buffers, which is far lighter
+    across Streamlit reruns than object-dtype pandas columns full of shapely
+    geometries; the GeoDataFrame is materialized again on demand via load_gdf.
+    """
+    try:
+        st.session_state.gdf_arrow = pa.table(gdf.to_arrow(geometry_encoding="geoarrow"))
+    except Exception:
+        # Mixed geometry types cannot be GeoArrow-encoded; fall back to WKB
+        st.session_state.gdf_arrow = pa.table(gdf.to_arrow())
+    # Probe geometry types/bounds once here instead of on every rerun
+    st.session_state.geom_info = extract_geometry_info(gdf)
+    # Pre-render a bounded preview so display never touches the full frame
+    st.session_state.gdf_head = preview_dataframe(gdf, n=100)
+
+def load_gdf():
+    """Materialize the session GeoDataFrame from its Arrow representation."""
+    if st.session_state.gdf_arrow is None:
+        return None
+    return gpd.GeoDataFrame.from_arrow(st.session_state.gdf_arrow)
+
+def preview_dataframe(gdf, n=5):
+    """Build a small display frame with geometries rendered as short WKT.
+
+    Displaying a GeoDataFrame goes through the Python repr per geometry cell;
+    trimmed vectorized WKT keeps the preview cheap on complex polygon inputs.
+    """
+    head = gdf.head(n)
+    preview = pd.DataFrame(head.drop(columns=[head.geometry.name]))
+    preview['geometry'] = shapely.to_wkt(head.geometry.values, rounding_precision=4)
+    return preview
+
+def geodataframe_to_geojson(gdf):
+    """Serialize a GeoDataFrame to a GeoJSON FeatureCollection string.
+
+    Geometries are serialized in one vectorized shapely.to_geojson call and the
+    attributes with the (or)json encoder, avoiding GeoDataFrame.to_json's
+    per-feature Python dispatch.
+    """
+    def dumps(obj):
+        encoded = json.dumps(obj, default=str)
+        # orjson returns bytes, stdlib json returns str
+        return encoded.decode() if isinstance(encoded, bytes) else encoded
+
+    geom_json = shapely.to_geojson(gdf.geometry.values)
+    properties = gdf.drop(columns=[gdf.geometry.name]).to_dict(orient="records")
+    features = [
+        '{"type":"Feature","properties":' + dumps(props)
+        + ',"geometry":' + (geom if geom is not None else 'null') + '}'
+        for props, geom in zip(properties, geom_json)
+    ]
+    return '{"type":"FeatureCollection","features":[' + ','.join(features) + ']}'
+
+def read_vsimem_file(vsi_path):
+    """Read a file from GDAL's in-memory filesystem and delete it."""
+    vsi_file = gdal.VSIFOpenL(vsi_path, "rb")
+    try:
+        size = gdal.VSIStatL(vsi_path).size
+        data = gdal.VSIFReadL(1, size, vsi_file)
+    finally:
+        gdal.VSIFCloseL(vsi_file)
+    gdal.Unlink(vsi_path)
+    return bytes(data)
+
+def deflate_part(name, data):
+    """Deflate one zip member's payload; runs on a worker thread."""
+    compressor = zlib.compressobj(1, zlib.DEFLATED, -15)  # raw deflate, no header
+    return name, len(data), zlib.crc32(data), compressor.compress(data) + compressor.flush()
+
+def write_precompressed(zip_file, name, raw_size, crc, compressed):
+    """Append an already-deflated member to an open ZipFile.
+
+    zipfile has no API for pre-compressed payloads, so fill in the ZipInfo
+    bookkeeping ourselves; this is what lets the deflate step run on threads.
+    """
+    zinfo = zipfile.ZipInfo(name)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.file_size = raw_size
+    zinfo.CRC = crc
+    zinfo.compress_size = len(compressed)
+    zinfo.header_offset = zip_file.fp.tell()
+    zip_file.fp.write(zinfo.FileHeader(False))
+    zip_file.fp.write(compressed)
+    zip_file.filelist.append(zinfo)
+    zip_file.NameToInfo[zinfo.filename] = zinfo
+    zip_file.start_dir = zip_file.fp.tell()
+
 def save_file_to_zip(gdf, file_format, filename="converted_data"):
     """Save a GeoDataFrame to a specified format and compress it into a ZIP file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        temp_path = Path(tmpdir)
-        
-        if file_format == "shp":
+    if file_format == "shp":
+        if gdal is not None:
+            # Write shapefile components to GDAL's in-memory filesystem and
+            # collect them as bytes - no disk round-trip. /vsimem/ is shared by
+            # every session in the process, so write under a unique name and
+            # collect the known sibling extensions instead of listing the root
+            vsi_base = f"/vsimem/{filename}-{uuid.uuid4().hex}"
+            pyogrio.write_dataframe(gdf, f"{vsi_base}.shp", driver="ESRI Shapefile")
+            parts = [
+                (f"{filename}{ext}", read_vsimem_file(f"{vsi_base}{ext}"))
+                for ext in ('.shp', '.shx', '.dbf', '.prj', '.cpg')
+                if gdal.VSIStatL(f"{vsi_base}{ext}") is not None
+            ]
+        else:
             # Shapefile creates multiple files, so save to temp directory
-            shapefile_path = temp_path / filename
-            gdf.to_file(shapefile_path, driver="ESRI Shapefile")
-            
-            # Create zip file containing all shapefile components
-            zip_buffer = io.BytesIO()
-            with zipfile.ZipFile(zip_buffer, 'a', zipfile.ZIP_DEFLATED) as zip_file:
-                for file_path in temp_path.glob(f"{filename}.*"):
-                    zip_file.write(file_path, arcname=file_path.name)
-            
-            zip_buffer.seek(0)
-            return zip_buffer.getvalue()
-        
-        elif file_format == "gpkg":
-            gpkg_path = temp_path / f"{filename}.gpkg"
-            gdf.to_file(gpkg_path, driver="GPKG")
-            
-            with open(gpkg_path, "rb") as f:
-                return f.read()
+            with tempfile.TemporaryDirectory() as tmpdir:
+                temp_path = Path(tmpdir)
+                gdf.to_file(temp_path / f"{filename}.shp", driver="ESRI Shapefile", engine="pyogrio")
+                # scandir avoids the extra stat() per file that glob pays
+                with os.scandir(tmpdir) as entries:
+                    parts = [
+                        (entry.name, Path(entry.path).read_bytes())
+                        for entry in entries
+                        if entry.is_file() and entry.name.startswith(f"{filename}.")
+                    ]
+
+        # Deflate each component on its own thread (zlib releases the GIL),
+        # then append the pre-compressed payloads in order
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(parts))) as pool:
+            compressed_parts = list(pool.map(lambda part: deflate_part(*part), parts))
+
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zip_file:
+            for name, raw_size, crc, payload in compressed_parts:
+                write_precompressed(zip_file, name, raw_size, crc, payload)
+
+        zip_buffer.seek(0)
+        return zip_buffer.getvalue()
+
+    elif file_format == "gpkg":
+        # The file is streamed to the user and discarded, so SQLite durability
+        # guarantees are wasted work; skip fsyncs and journal flushing. The
+        # pragma option is process-global, hence the lock around set/write/reset
+        with GPKG_WRITE_LOCK:
+            pyogrio.set_gdal_config_options(
+                {"OGR_SQLITE_PRAGMA": "synchronous=OFF,journal_mode=MEMORY,temp_store=MEMORY"}
+            )
+            try:
+                if gdal is not None:
+                    # Write straight to GDAL's in-memory filesystem; skips the temp file
+                    # write, read-back and extra buffer copy. Unique name because
+                    # /vsimem/ is shared across sessions
+                    vsi_path = f"/vsimem/{filename}-{uuid.uuid4().hex}.gpkg"
+                    pyogrio.write_dataframe(gdf, vsi_path, driver="GPKG")
+                    return read_vsimem_file(vsi_path)
+
+                # SQLite needs a real file descriptor, so a file-like target would
+                # silently bounce through a hidden temp file anyway; make it explicit
+                with tempfile.NamedTemporaryFile(suffix=".gpkg", delete=False) as tf:
+                    gpkg_path = tf.name
+                try:
+                    pyogrio.write_dataframe(gdf, gpkg_path, driver="GPKG")
+                    with open(gpkg_path, "rb") as f:
+                        return f.read()
+                finally:
+                    os.unlink(gpkg_path)
+            finally:
+                pyogrio.set_gdal_config_options({"OGR_SQLITE_PRAGMA": None})
 
 def extract_geometry_info(gdf):
     """Extract information about the geometries in the GeoDataFrame."""
@@ -166,10 +456,12 @@ st.title("Geospatial Data Format Converter")
 st.write("Convert between CSV, GeoJSON, Parquet, Shapefile, and GeoPackage formats")
 
 # Initialize session state variables if they don't exist
-if 'gdf' not in st.session_state:
-    st.session_state.gdf = None
+if 'gdf_arrow' not in st.session_state:
+    st.session_state.gdf_arrow = None
 if 'show_output_options' not in st.session_state:
     st.session_state.show_output_options = False
+if 'csv_points_source' not in st.session_state:
+    st.session_state.csv_points_source = None
 
 # File uploader
 uploaded_file = st.file_uploader("Upload your file", type=["csv", "geojson", "parquet", "gpkg", "zip"], key="file_uploader")
@@ -177,6 +469,18 @@ uploaded_file = st.file_uploader("Upload your file", type=["csv", "geojson", "pa
 if uploaded_file is not None:
     # Determine file type from extension
     file_extension = uploaded_file.name.split(".")[-1].lower()
+
+    # Snapshot the upload's bytes once; every rerun after that is a dict lookup
+    # instead of a fresh copy out of the upload buffer. Key on content (first
+    # 1 MiB + size) rather than filename, so a renamed identical file reuses
+    # the snapshot and a same-named different file invalidates it
+    file_key = hashlib.blake2b(
+        uploaded_file.getbuffer()[:1 << 20], digest_size=16
+    ).hexdigest() + f":{uploaded_file.size}"
+    if st.session_state.get('file_key') != file_key:
+        st.session_state.raw_bytes = uploaded_file.getvalue()
+        st.session_state.file_key = file_key
+    raw_bytes = st.session_state.raw_bytes
     
     try:
         # Process the file based on its type
@@ -220,16 +524,17 @@ if uploaded_file is not None:
                     prefix = st.text_input("Column prefix", "col")
                     # Only set header=None and names with prefix when no header
                     csv_options["header"] = None
-                    # Generate column names with prefix
-                    preview_df = pd.read_csv(uploaded_file, sep=selected_sep, nrows=1)
-                    num_cols = len(preview_df.columns)
+                    # Generate column names with prefix; count separators on the
+                    # first raw line instead of re-parsing the file just for that
+                    first_line = raw_bytes.split(b'\n', 1)[0]
+                    num_cols = first_line.count(selected_sep.encode()) + 1
                     csv_options["names"] = [f"{prefix}{i}" for i in range(num_cols)]
                 else:
                     csv_options["header"] = 0
             
             # Try to read the CSV with selected separator
             try:
-                df = pd.read_csv(uploaded_file, sep=selected_sep, **csv_options)
+                df = read_csv_cached(raw_bytes, selected_sep, **csv_options)
                 st.write("CSV file preview:")
                 st.dataframe(df.head())
                 
@@ -259,15 +564,29 @@ if uploaded_file is not None:
                         
                     crs = st.text_input("Coordinate Reference System", "EPSG:4326")
                     
-                    if st.button("Create GeoDataFrame from Points"):
+                    if st.button("Create GeoDataFrame from Points") and validate_crs(crs) is not None:
                         # Create GeoDataFrame using point coordinates
                         gdf = convert_csv_to_geodataframe(df, 'points', lon_col=lon_col, lat_col=lat_col, crs=crs)
-                        st.session_state.gdf = gdf
+                        store_gdf(gdf)
+                        # Remember the source so the Parquet output path can
+                        # re-stream it in batches (default dialect only)
+                        if (csv_options.get("header") == 0
+                                and csv_options.get("decimal") == "."
+                                and csv_options.get("encoding", "utf-8") == "utf-8"):
+                            st.session_state.csv_points_source = {
+                                "raw_bytes": raw_bytes,
+                                "sep": selected_sep,
+                                "lon_col": lon_col,
+                                "lat_col": lat_col,
+                                "crs": crs
+                            }
+                        else:
+                            st.session_state.csv_points_source = None
                         st.write("GeoDataFrame created successfully!")
                         st.write("Preview:")
-                        st.dataframe(gdf.head())
+                        st.dataframe(st.session_state.gdf_head)
                         st.write("Geometry Information:")
-                        st.markdown(extract_geometry_info(gdf))
+                        st.markdown(st.session_state.geom_info)
                         st.session_state.show_output_options = True
                         
                 elif geometry_mode == "WKT geometry column":
@@ -276,15 +595,16 @@ if uploaded_file is not None:
                                         index=0 if geom_col_options else 0)
                     crs = st.text_input("Coordinate Reference System", "EPSG:4326")
                     
-                    if st.button("Create GeoDataFrame from WKT"):
+                    if st.button("Create GeoDataFrame from WKT") and validate_crs(crs) is not None:
                         # Create GeoDataFrame using WKT geometry
                         gdf = convert_csv_to_geodataframe(df, 'wkt', geom_col=geom_col, crs=crs)
-                        st.session_state.gdf = gdf
+                        store_gdf(gdf)
+                        st.session_state.csv_points_source = None
                         st.write("GeoDataFrame created successfully!")
                         st.write("Preview:")
-                        st.dataframe(gdf.head())
+                        st.dataframe(st.session_state.gdf_head)
                         st.write("Geometry Information:")
-                        st.markdown(extract_geometry_info(gdf))
+                        st.markdown(st.session_state.geom_info)
                         st.session_state.show_output_options = True
                         
                 elif geometry_mode == "GeoJSON geometry column":
@@ -293,15 +613,16 @@ if uploaded_file is not None:
                                         index=0 if geom_col_options else 0)
                     crs = st.text_input("Coordinate Reference System", "EPSG:4326")
                     
-                    if st.button("Create GeoDataFrame from GeoJSON"):
+                    if st.button("Create GeoDataFrame from GeoJSON") and validate_crs(crs) is not None:
                         # Create GeoDataFrame using GeoJSON geometry
                         gdf = convert_csv_to_geodataframe(df, 'geojson', geom_col=geom_col, crs=crs)
-                        st.session_state.gdf = gdf
+                        store_gdf(gdf)
+                        st.session_state.csv_points_source = None
                         st.write("GeoDataFrame created successfully!")
                         st.write("Preview:")
-                        st.dataframe(gdf.head())
+                        st.dataframe(st.session_state.gdf_head)
                         st.write("Geometry Information:")
-                        st.markdown(extract_geometry_info(gdf))
+                        st.markdown(st.session_state.geom_info)
                         st.session_state.show_output_options = True
                         
             except pd.errors.ParserError as e:
@@ -309,26 +630,21 @@ if uploaded_file is not None:
                 st.info("Try a different separator or check if the file is properly formatted.")
             
         elif file_extension in ["geojson", "parquet", "gpkg"]:
-            # Determine the appropriate method to read the file
-            if file_extension == "geojson":
-                gdf = gpd.read_file(uploaded_file)
-            elif file_extension == "parquet":
-                gdf = gpd.read_parquet(uploaded_file)
-            elif file_extension == "gpkg":
-                gdf = gpd.read_file(uploaded_file, driver="GPKG")
-                
-            st.session_state.gdf = gdf
+            gdf = read_geofile_cached(raw_bytes, file_extension)
+
+            store_gdf(gdf)
+            st.session_state.csv_points_source = None
             st.write(f"{file_extension.upper()} data preview:")
-            st.dataframe(gdf.head())
+            st.dataframe(st.session_state.gdf_head)
             st.write("Geometry Information:")
-            st.markdown(extract_geometry_info(gdf))
+            st.markdown(st.session_state.geom_info)
             st.session_state.show_output_options = True
             
         elif file_extension == "zip":
             # Check if it's likely a zipped shapefile
             try:
                 with tempfile.TemporaryDirectory() as tmpdir:
-                    with zipfile.ZipFile(uploaded_file, 'r') as zip_ref:
+                    with zipfile.ZipFile(io.BytesIO(raw_bytes), 'r') as zip_ref:
                         zip_ref.extractall(tmpdir)
                     
                     # Look for .shp file
@@ -336,18 +652,19 @@ if uploaded_file is not None:
                     if not shp_files:
                         st.error("No .shp file found in the ZIP archive.")
                     else:
-                        gdf = gpd.read_file(shp_files[0])
-                        st.session_state.gdf = gdf
+                        gdf = gpd.read_file(shp_files[0], engine="pyogrio", use_arrow=True)
+                        store_gdf(gdf)
+                        st.session_state.csv_points_source = None
                         st.write("Shapefile data preview:")
-                        st.dataframe(gdf.head())
+                        st.dataframe(st.session_state.gdf_head)
                         st.write("Geometry Information:")
-                        st.markdown(extract_geometry_info(gdf))
+                        st.markdown(st.session_state.geom_info)
                         st.session_state.show_output_options = True
             except Exception as e:
                 st.error(f"Error processing ZIP file: {str(e)}")
         
         # Show output options if we have a GeoDataFrame
-        if st.session_state.show_output_options and st.session_state.gdf is not None:
+        if st.session_state.show_output_options and st.session_state.gdf_arrow is not None:
             st.subheader("Convert to:")
             
             # All possible output formats
@@ -373,11 +690,11 @@ if uploaded_file is not None:
             )
             
             # Get the GeoDataFrame from session state
-            gdf = st.session_state.gdf
+            gdf = load_gdf()
             
             # Generate download data based on selected format
             if output_format == "geojson":
-                geojson_data = gdf.to_json()
+                geojson_data = geodataframe_to_geojson(gdf)
                 st.download_button(
                     label="Download GeoJSON",
                     data=geojson_data,
@@ -387,12 +704,37 @@ if uploaded_file is not None:
                 )
             
             elif output_format == "parquet":
-                parquet_buffer = io.BytesIO()
-                gdf.to_parquet(parquet_buffer)
-                parquet_buffer.seek(0)
+                if st.session_state.csv_points_source is not None:
+                    # Re-stream the source CSV in record batches so memory stays
+                    # bounded even when the input is larger than RAM
+                    parquet_data = stream_csv_points_to_parquet(**st.session_state.csv_points_source)
+                else:
+                    parquet_buffer = io.BytesIO()
+                    # GeoArrow encoding keeps coordinates as native float columns (no WKB
+                    # decode for readers) and the covering bbox enables row-group skipping
+                    try:
+                        gdf.to_parquet(
+                            parquet_buffer,
+                            geometry_encoding="geoarrow",
+                            write_covering_bbox=True,
+                            compression="zstd",
+                            compression_level=3,
+                            row_group_size=64_000
+                        )
+                    except Exception:
+                        # Mixed geometry types cannot be GeoArrow-encoded; fall back to WKB
+                        parquet_buffer = io.BytesIO()
+                        gdf.to_parquet(
+                            parquet_buffer,
+                            compression="zstd",
+                            compression_level=3,
+                            row_group_size=64_000
+                        )
+                    parquet_buffer.seek(0)
+                    parquet_data = parquet_buffer
                 st.download_button(
                     label="Download GeoParquet",
-                    data=parquet_buffer,
+                    data=parquet_data,
                     file_name="converted_data.parquet",
                     mime="application/octet-stream",
                     key="download_button_parquet"  # Unique key for this download button